@@ -16,6 +16,7 @@ import yarl
 from typing import (
     Any,
     Dict,
+    Final,
     Iterable,
     List,
     Mapping,
@@ -45,6 +46,7 @@ from aiohttp import web, hdrs
 from async_timeout import timeout
 from dateutil.parser import isoparse
 from dateutil.tz import tzutc
+from sqlalchemy.engine.row import Row
 from sqlalchemy.sql.expression import true, null
 
 from ai.backend.manager.models.image import ImageRow
@@ -143,6 +145,18 @@ log = BraceStyleAdapter(logging.getLogger(__name__))
 
 _json_loads = functools.partial(json.loads, parse_float=Decimal)
 
+# Polls the main kernel row for up to 0.5 seconds after the session start event.
+_started_kernel_poll_interval: Final = 0.1
+_started_kernel_poll_count: Final = 6
+# The kernel statuses that may still change into RUNNING while polling.
+_kernel_startup_statuses: Final = frozenset([
+    KernelStatus.PENDING,
+    KernelStatus.SCHEDULED,
+    KernelStatus.PREPARING,
+    KernelStatus.BUILDING,
+    KernelStatus.PULLING,
+])
+
 
 class UndefChecker(t.Trafaret):
     def check_and_return(self, value: Any) -> object:
@@ -389,6 +403,34 @@ async def _query_userinfo(
     return owner_uuid, group_id, resource_policy
 
 
+async def _query_started_kernel(root_ctx: RootContext, kernel_id: KernelId) -> Row:
+    """
+    Read the status and service ports of the main kernel after its session has started.
+
+    The kernel row may be updated slightly after the session start event is delivered.
+    Instead of sleeping for a fixed grace period before reading it, poll it briefly
+    and return as soon as it leaves the startup statuses (e.g., RUNNING or ERROR).
+    If it is still starting up after the grace period, the last read row is returned.
+    """
+    query = (
+        sa.select([
+            kernels.c.status,
+            kernels.c.service_ports,
+        ])
+        .select_from(kernels)
+        .where(kernels.c.id == kernel_id)
+    )
+    for retry in range(_started_kernel_poll_count):
+        if retry > 0:
+            await asyncio.sleep(_started_kernel_poll_interval)
+        async with root_ctx.db.begin_readonly() as conn:
+            result = await conn.execute(query)
+            row = result.first()
+        if row['status'] not in _kernel_startup_statuses:
+            break
+    return row
+
+
 async def _create(request: web.Request, params: dict[str, Any]) -> web.Response:
     if params['domain'] is None:
         params['domain'] = request['user']['domain_name']
@@ -561,18 +603,7 @@ async def _create(request: web.Request, params: dict[str, Any]) -> web.Response:
             except asyncio.TimeoutError:
                 resp['status'] = 'TIMEOUT'
             else:
-                await asyncio.sleep(0.5)
-                async with root_ctx.db.begin_readonly() as conn:
-                    query = (
-                        sa.select([
-                            kernels.c.status,
-                            kernels.c.service_ports,
-                        ])
-                        .select_from(kernels)
-                        .where(kernels.c.id == kernel_id)
-                    )
-                    result = await conn.execute(query)
-                    row = result.first()
+                row = await _query_started_kernel(root_ctx, kernel_id)
                 if row['status'] == KernelStatus.RUNNING:
                     resp['status'] = 'RUNNING'
                     for item in row['service_ports']:
@@ -1066,18 +1097,7 @@ async def create_cluster(request: web.Request, params: dict[str, Any]) -> web.Re
             except asyncio.TimeoutError:
                 resp['status'] = 'TIMEOUT'
             else:
-                await asyncio.sleep(0.5)
-                async with root_ctx.db.begin_readonly() as conn:
-                    query = (
-                        sa.select([
-                            kernels.c.status,
-                            kernels.c.service_ports,
-                        ])
-                        .select_from(kernels)
-                        .where(kernels.c.id == kernel_id)
-                    )
-                    result = await conn.execute(query)
-                    row = result.first()
+                row = await _query_started_kernel(root_ctx, kernel_id)
                 if row['status'] == KernelStatus.RUNNING:
                     resp['status'] = 'RUNNING'
                     for item in row['service_ports']:
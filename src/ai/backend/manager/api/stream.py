@@ -19,6 +19,7 @@ from typing import (
     Any,
     AsyncIterator,
     DefaultDict,
+    Dict,
     Iterable,
     List,
     Mapping,
@@ -73,6 +74,29 @@ if TYPE_CHECKING:
 log = BraceStyleAdapter(logging.getLogger(__name__))
 
 
+def _track(
+    registry: MutableMapping[KernelId, weakref.WeakSet[Any]],
+    key: KernelId,
+    item: Any,
+) -> None:
+    registry.setdefault(key, weakref.WeakSet()).add(item)
+
+
+def _untrack(
+    registry: MutableMapping[KernelId, weakref.WeakSet[Any]],
+    key: KernelId,
+    item: Any,
+) -> None:
+    # Drop the per-kernel entry once it becomes empty so that the registry
+    # does not keep growing with the kernels that have ever been streamed.
+    items = registry.get(key)
+    if items is None:
+        return
+    items.discard(item)
+    if not items:
+        del registry[key]
+
+
 @server_status_required(READ_ALLOWED)
 @auth_required
 @adefer
@@ -100,8 +124,8 @@ async def stream_pty(defer, request: web.Request) -> web.StreamResponse:
 
     myself = asyncio.current_task()
     assert myself is not None
-    app_ctx.stream_pty_handlers[stream_key].add(myself)
-    defer(lambda: app_ctx.stream_pty_handlers[stream_key].discard(myself))
+    _track(app_ctx.stream_pty_handlers, stream_key, myself)
+    defer(lambda: _untrack(app_ctx.stream_pty_handlers, stream_key, myself))
 
     async def connect_streams(compute_session) -> Tuple[zmq.asyncio.Socket, zmq.asyncio.Socket]:
         # TODO: refactor as custom row/table method
@@ -124,8 +148,8 @@ async def stream_pty(defer, request: web.Request) -> web.StreamResponse:
 
     # Wrap sockets in a list so that below coroutines can share reference changes.
     socks = list(await connect_streams(compute_session))
-    app_ctx.stream_stdin_socks[stream_key].add(socks[0])
-    defer(lambda: app_ctx.stream_stdin_socks[stream_key].discard(socks[0]))
+    _track(app_ctx.stream_stdin_socks, stream_key, socks[0])
+    defer(lambda: _untrack(app_ctx.stream_stdin_socks, stream_key, socks[0]))
     stream_sync = asyncio.Event()
 
     async def stream_stdin():
@@ -140,7 +164,7 @@ async def stream_pty(defer, request: web.Request) -> web.StreamResponse:
                             await socks[0].send_mlutipart([raw_data])
                         except (RuntimeError, zmq.error.ZMQError):
                             # when socks[0] is closed, re-initiate the connection.
-                            app_ctx.stream_stdin_socks[stream_key].discard(socks[0])
+                            _untrack(app_ctx.stream_stdin_socks, stream_key, socks[0])
                             socks[1].close()
                             kernel = await asyncio.shield(
                                 database_ptask_group.create_task(
@@ -153,7 +177,7 @@ async def stream_pty(defer, request: web.Request) -> web.StreamResponse:
                             stdin_sock, stdout_sock = await connect_streams(kernel)
                             socks[0] = stdin_sock
                             socks[1] = stdout_sock
-                            app_ctx.stream_stdin_socks[stream_key].add(socks[0])
+                            _track(app_ctx.stream_stdin_socks, stream_key, socks[0])
                             socks[0].write([raw_data])
                             log.debug('stream_stdin({0}): zmq stream reset',
                                       stream_key)
@@ -297,8 +321,8 @@ async def stream_execute(defer, request: web.Request) -> web.StreamResponse:
 
     myself = asyncio.current_task()
     assert myself is not None
-    app_ctx.stream_execute_handlers[stream_key].add(myself)
-    defer(lambda: app_ctx.stream_execute_handlers[stream_key].discard(myself))
+    _track(app_ctx.stream_execute_handlers, stream_key, myself)
+    defer(lambda: _untrack(app_ctx.stream_execute_handlers, stream_key, myself))
 
     # This websocket connection itself is a "run".
     run_id = secrets.token_hex(8)
@@ -413,8 +437,8 @@ async def stream_proxy(defer, request: web.Request, params: Mapping[str, Any]) -
         raise
     stream_key = kernel['id']
     stream_id = uuid.uuid4().hex
-    app_ctx.stream_proxy_handlers[stream_key].add(myself)
-    defer(lambda: app_ctx.stream_proxy_handlers[stream_key].discard(myself))
+    _track(app_ctx.stream_proxy_handlers, stream_key, myself)
+    defer(lambda: _untrack(app_ctx.stream_proxy_handlers, stream_key, myself))
     if kernel['kernel_host'] is None:
         kernel_host = urlparse(kernel['agent_addr']).hostname
     else:
@@ -466,23 +490,24 @@ async def stream_proxy(defer, request: web.Request, params: Mapping[str, Any]) -
         redis.call('ZADD', KEYS[1], now, ARGV[1])
     ''')
 
+    # refresh_cb() is called for every proxied message, so bind the tracker update once here.
+    update_conn_tracker = apartial(
+        redis.execute_script,
+        redis_live, 'update_conn_tracker', _conn_tracker_script,
+        [conn_tracker_key],
+        [conn_tracker_val],
+    )
+
     async def refresh_cb(kernel_id: str, data: bytes) -> None:
         await asyncio.shield(rpc_ptask_group.create_task(
             call_non_bursty(
                 conn_tracker_key,
-                apartial(
-                    redis.execute_script,
-                    redis_live, 'update_conn_tracker', _conn_tracker_script,
-                    [conn_tracker_key],
-                    [conn_tracker_val],
-                ),
+                update_conn_tracker,
                 max_bursts=128, max_idle=5000,
             ),
         ))
 
-    down_cb = apartial(refresh_cb, kernel['id'])
-    up_cb = apartial(refresh_cb, kernel['id'])
-    ping_cb = apartial(refresh_cb, kernel['id'])
+    down_cb = up_cb = ping_cb = apartial(refresh_cb, kernel['id'])
 
     kernel_id = kernel['id']
 
@@ -608,7 +633,7 @@ async def handle_kernel_terminating(
     if kernel['cluster_role'] == DEFAULT_ROLE:
         stream_key = kernel['id']
         cancelled_tasks = []
-        for sock in app_ctx.stream_stdin_socks[stream_key]:
+        for sock in list(app_ctx.stream_stdin_socks.get(stream_key, [])):
             sock.close()
         for handler in list(app_ctx.stream_pty_handlers.get(stream_key, [])):
             handler.cancel()
@@ -626,14 +651,16 @@ async def handle_kernel_terminating(
 async def stream_conn_tracker_gc(root_ctx: RootContext, app_ctx: PrivateContext) -> None:
     redis_live = root_ctx.redis_live
     shared_config: SharedConfig = root_ctx.shared_config
+    timeout_iv = tx.TimeDuration()
     try:
         while True:
-            no_packet_timeout: timedelta = tx.TimeDuration().check(
+            no_packet_timeout: timedelta = timeout_iv.check(
                 await shared_config.etcd.get('config/idle/app-streaming-packet-timeout') or '5m',
             )
             async with app_ctx.conn_tracker_lock:
                 now = await redis.execute(redis_live, lambda r: r.time())
                 now = now[0] + (now[1] / (10**6))
+                expire_before = now - no_packet_timeout.total_seconds()
                 for session_id in app_ctx.active_session_ids.keys():
                     conn_tracker_key = f"session.{session_id}.active_app_connections"
                     prev_remaining_count = await redis.execute(
@@ -643,15 +670,17 @@ async def stream_conn_tracker_gc(root_ctx: RootContext, app_ctx: PrivateContext)
                     removed_count = await redis.execute(
                         redis_live,
                         lambda r: r.zremrangebyscore(
-                            conn_tracker_key, float('-inf'), now - no_packet_timeout.total_seconds(),
+                            conn_tracker_key, float('-inf'), expire_before,
                         ),
                     )
                     remaining_count = await redis.execute(
                         redis_live,
                         lambda r: r.zcount(conn_tracker_key, float('-inf'), float('+inf')),
                     )
-                    log.debug(f"conn_tracker: gc {session_id} "
-                              f"removed/remaining = {removed_count}/{remaining_count}")
+                    log.debug(
+                        "conn_tracker: gc {} removed/remaining = {}/{}",
+                        session_id, removed_count, remaining_count,
+                    )
                     if prev_remaining_count > 0 and remaining_count == 0:
                         await root_ctx.idle_checker_host.update_app_streaming_status(
                             session_id,
@@ -664,10 +693,10 @@ async def stream_conn_tracker_gc(root_ctx: RootContext, app_ctx: PrivateContext)
 
 @attr.s(slots=True, auto_attribs=True, init=False)
 class PrivateContext:
-    stream_pty_handlers: DefaultDict[KernelId, weakref.WeakSet[asyncio.Task]]
-    stream_execute_handlers: DefaultDict[KernelId, weakref.WeakSet[asyncio.Task]]
-    stream_proxy_handlers: DefaultDict[KernelId, weakref.WeakSet[asyncio.Task]]
-    stream_stdin_socks: DefaultDict[KernelId, weakref.WeakSet[zmq.asyncio.Socket]]
+    stream_pty_handlers: Dict[KernelId, weakref.WeakSet[asyncio.Task]]
+    stream_execute_handlers: Dict[KernelId, weakref.WeakSet[asyncio.Task]]
+    stream_proxy_handlers: Dict[KernelId, weakref.WeakSet[asyncio.Task]]
+    stream_stdin_socks: Dict[KernelId, weakref.WeakSet[zmq.asyncio.Socket]]
     zctx: zmq.asyncio.Context
     conn_tracker_lock: asyncio.Lock
     conn_tracker_gc_task: asyncio.Task
@@ -678,10 +707,10 @@ async def stream_app_ctx(app: web.Application) -> AsyncIterator[None]:
     root_ctx: RootContext = app['_root.context']
     app_ctx: PrivateContext = app['stream.context']
 
-    app_ctx.stream_pty_handlers = defaultdict(weakref.WeakSet)
-    app_ctx.stream_execute_handlers = defaultdict(weakref.WeakSet)
-    app_ctx.stream_proxy_handlers = defaultdict(weakref.WeakSet)
-    app_ctx.stream_stdin_socks = defaultdict(weakref.WeakSet)
+    app_ctx.stream_pty_handlers = {}
+    app_ctx.stream_execute_handlers = {}
+    app_ctx.stream_proxy_handlers = {}
+    app_ctx.stream_stdin_socks = {}
     app_ctx.zctx = zmq.asyncio.Context()
     app_ctx.conn_tracker_lock = asyncio.Lock()
     app_ctx.active_session_ids = defaultdict(int)  # multiset[int]
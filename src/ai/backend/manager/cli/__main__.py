@@ -10,9 +10,7 @@ from pathlib import Path
 
 import aioredis, aioredis.client
 import click
-import psycopg2
 import sqlalchemy as sa
-from more_itertools import chunked
 from setproctitle import setproctitle
 
 from ai.backend.common import redis as redis_helper
@@ -136,6 +134,9 @@ def clear_history(cli_ctx: CLIContext, retention, vacuum_full) -> None:
     Delete old records from the kernels table and
     invoke the PostgreSQL's vaccuum operation to clear up the actual disk space.
     """
+    import psycopg2
+    from more_itertools import chunked
+
     local_config = cli_ctx.local_config
     with cli_ctx.logger:
         today = datetime.now()
@@ -286,7 +286,7 @@ class TimeoutIdleChecker(BaseIdleChecker):
             await self._update_timeout(session_id)
 
     async def _disable_timeout(self, session_id: SessionId) -> None:
-        log.debug(f"TimeoutIdleChecker._disable_timeout({session_id})")
+        log.debug("TimeoutIdleChecker._disable_timeout({})", session_id)
         await redis_helper.execute(
             self._redis_live,
             lambda r: r.set(
@@ -295,7 +295,7 @@ class TimeoutIdleChecker(BaseIdleChecker):
         )
 
     async def _update_timeout(self, session_id: SessionId) -> None:
-        log.debug(f"TimeoutIdleChecker._update_timeout({session_id})")
+        log.debug("TimeoutIdleChecker._update_timeout({})", session_id)
         t = await redis_helper.execute(self._redis_live, lambda r: r.time())
         t = t[0] + (t[1] / (10**6))
         await redis_helper.execute(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import pkg_resources
 from contextvars import ContextVar
@@ -12,6 +13,7 @@ from typing import (
     List,
     Sequence,
     Tuple,
+    Type,
     Union,
     TYPE_CHECKING,
     Optional,
@@ -107,20 +109,27 @@ _log_args: ContextVar[Tuple[Any, ...]] = ContextVar('_log_args')
 _key_schedule_prep_tasks: Final = "scheduler.preptasks"
 
 
-def load_scheduler(
-    name: str,
-    sgroup_opts: ScalingGroupOpts,
-    scheduler_config: dict[str, Any],
-) -> AbstractScheduler:
+@functools.lru_cache(maxsize=None)
+def _find_scheduler_cls(name: str) -> Type[AbstractScheduler]:
+    # Scanning the entrypoints is expensive and their set does not change
+    # while the process is running, so we resolve each plugin name only once.
     entry_prefix = 'backendai_scheduler_v10'
     for entrypoint in pkg_resources.iter_entry_points(entry_prefix):
         if entrypoint.name == name:
             log.debug('loading scheduler plugin "{}" from {}', name, entrypoint.module_name)
-            scheduler_cls = entrypoint.load()
-            return scheduler_cls(sgroup_opts, scheduler_config)
+            return entrypoint.load()
     raise ImportError('Cannot load the scheduler plugin', name)
 
 
+def load_scheduler(
+    name: str,
+    sgroup_opts: ScalingGroupOpts,
+    scheduler_config: dict[str, Any],
+) -> AbstractScheduler:
+    scheduler_cls = _find_scheduler_cls(name)
+    return scheduler_cls(sgroup_opts, scheduler_config)
+
+
 StartTaskArgs = Tuple[
     Tuple[Any, ...],
     SchedulingContext,
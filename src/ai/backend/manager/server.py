@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager as actxmgr, closing
 from datetime import datetime
 import functools
 import importlib
+import json
 import logging
 import os
 import pwd, grp
@@ -14,6 +15,7 @@ import traceback
 from typing import (
     Any,
     AsyncIterator,
+    Coroutine,
     Final,
     Iterable,
     List,
@@ -29,7 +31,6 @@ import aiotools
 import click
 from pathlib import Path
 from setproctitle import setproctitle
-import aiomonitor
 
 from ai.backend.common import redis
 from ai.backend.common.bgtask import BackgroundTaskManager
@@ -124,6 +125,12 @@ LATEST_REV_DATES: Final = {
 }
 LATEST_API_VERSION: Final = 'v6.20220315'
 
+# The version response never changes while the server is running, so serialize it once.
+_hello_body: Final = json.dumps({
+    'version': LATEST_API_VERSION,
+    'manager': __version__,
+})
+
 log = BraceStyleAdapter(logging.getLogger(__name__))
 
 PUBLIC_INTERFACES: Final = [
@@ -153,10 +160,7 @@ async def hello(request: web.Request) -> web.Response:
     """
     Returns the API version number.
     """
-    return web.json_response({
-        'version': LATEST_API_VERSION,
-        'manager': __version__,
-    })
+    return web.Response(text=_hello_body, content_type='application/json')
 
 
 async def on_prepare(request: web.Request, response: web.StreamResponse) -> None:
@@ -438,6 +442,17 @@ class background_task_ctx:
             await self.root_ctx.background_task_manager.shutdown()
 
 
+# Keeps strong references to the fire-and-forget error reporting tasks
+# so that they are not garbage-collected before completion.
+_error_report_tasks: set[asyncio.Task] = set()
+
+
+def _spawn_error_report(loop: asyncio.AbstractEventLoop, coro: Coroutine[Any, Any, None]) -> None:
+    task = loop.create_task(coro)
+    _error_report_tasks.add(task)
+    task.add_done_callback(_error_report_tasks.discard)
+
+
 def handle_loop_error(
     root_ctx: RootContext,
     loop: asyncio.AbstractEventLoop,
@@ -449,12 +464,12 @@ def handle_loop_error(
         if sys.exc_info()[0] is not None:
             log.exception('Error inside event loop: {0}', msg)
             if (error_monitor := getattr(root_ctx, 'error_monitor', None)) is not None:
-                loop.create_task(error_monitor.capture_exception())
+                _spawn_error_report(loop, error_monitor.capture_exception())
         else:
             exc_info = (type(exception), exception, exception.__traceback__)
             log.error('Error inside event loop: {0}', msg, exc_info=exc_info)
             if (error_monitor := getattr(root_ctx, 'error_monitor', None)) is not None:
-                loop.create_task(error_monitor.capture_exception(exc_instance=exception))
+                _spawn_error_report(loop, error_monitor.capture_exception(exc_instance=exception))
 
 
 def _init_subapp(
@@ -629,6 +644,8 @@ async def server_main(
 
     # Start aiomonitor.
     # Port is set by config (default=50001).
+    # (imported here to keep it out of the startup path of the click command)
+    import aiomonitor
     m = aiomonitor.Monitor(
         loop,
         port=root_ctx.local_config['manager']['aiomonitor-port'] + pidx,
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager as actxmgr
+from typing import Any, Mapping, Sequence
+from unittest.mock import AsyncMock, MagicMock
+import uuid
+
+import pytest
+
+from ai.backend.manager.api import session as session_mod
+from ai.backend.manager.models import KernelStatus
+
+
+def _mock_root_ctx(rows: Sequence[Mapping[str, Any]]) -> MagicMock:
+    """
+    Create a root context mock whose database returns the given kernel rows
+    in order, one row per read-only transaction.
+    """
+    root_ctx = MagicMock()
+    remaining_rows = iter(rows)
+
+    @actxmgr
+    async def begin_readonly():
+        result = MagicMock()
+        result.first.return_value = next(remaining_rows)
+        conn = MagicMock()
+        conn.execute = AsyncMock(return_value=result)
+        yield conn
+
+    root_ctx.db.begin_readonly = MagicMock(side_effect=begin_readonly)
+    return root_ctx
+
+
+@pytest.fixture
+def no_poll_interval(monkeypatch):
+    monkeypatch.setattr(session_mod, '_started_kernel_poll_interval', 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('final_status', [
+    KernelStatus.RUNNING,
+    KernelStatus.ERROR,
+    KernelStatus.TERMINATED,
+    KernelStatus.CANCELLED,
+])
+async def test_query_started_kernel_returns_early(no_poll_interval, final_status):
+    rows = [
+        {'status': KernelStatus.PREPARING, 'service_ports': []},
+        {'status': final_status, 'service_ports': []},
+    ]
+    root_ctx = _mock_root_ctx(rows)
+    row = await session_mod._query_started_kernel(root_ctx, uuid.uuid4())
+    assert row['status'] == final_status
+    assert root_ctx.db.begin_readonly.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_query_started_kernel_reports_last_status(no_poll_interval):
+    poll_count = session_mod._started_kernel_poll_count
+    rows = [
+        {'status': KernelStatus.PULLING, 'service_ports': []}
+        for _ in range(poll_count - 1)
+    ] + [
+        {'status': KernelStatus.PREPARING, 'service_ports': []},
+    ]
+    root_ctx = _mock_root_ctx(rows)
+    row = await session_mod._query_started_kernel(root_ctx, uuid.uuid4())
+    assert row['status'] == KernelStatus.PREPARING
+    assert root_ctx.db.begin_readonly.call_count == poll_count
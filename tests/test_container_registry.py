@@ -0,0 +1,21 @@
+import pytest
+
+from ai.backend.manager.container_registry import get_container_registry
+from ai.backend.manager.container_registry.docker import DockerHubRegistry, DockerRegistry_v2
+from ai.backend.manager.container_registry.harbor import HarborRegistry_v1, HarborRegistry_v2
+
+
+@pytest.mark.parametrize('registry_info, expected_cls', [
+    ({'': 'https://registry-1.docker.io', 'type': 'docker'}, DockerHubRegistry),
+    ({'': 'https://registry.example.com'}, DockerRegistry_v2),
+    ({'': 'https://registry.example.com', 'type': 'docker'}, DockerRegistry_v2),
+    ({'': 'https://harbor.example.com', 'type': 'harbor'}, HarborRegistry_v1),
+    ({'': 'https://harbor.example.com', 'type': 'harbor2'}, HarborRegistry_v2),
+])
+def test_get_container_registry(registry_info, expected_cls):
+    assert get_container_registry(registry_info) is expected_cls
+
+
+def test_get_container_registry_unsupported_type():
+    with pytest.raises(RuntimeError):
+        get_container_registry({'': 'https://registry.example.com', 'type': 'quay'})
@@ -14,6 +14,7 @@ from uuid import uuid4, UUID
 from pprint import pprint
 
 import attr
+import pkg_resources
 import pytest
 import trafaret as t
 from dateutil.parser import parse as dtparse
@@ -36,6 +37,7 @@ from ai.backend.manager.registry import AgentRegistry
 from ai.backend.manager.scheduler.dispatcher import (
     load_scheduler,
     SchedulerDispatcher,
+    _find_scheduler_cls,
     _list_pending_sessions,
 )
 from ai.backend.manager.scheduler.fifo import FIFOSlotScheduler, LIFOSlotScheduler
@@ -52,6 +54,18 @@ def test_load_intrinsic():
     assert isinstance(load_scheduler('mof', default_sgroup_opts, {}), MOFScheduler)
 
 
+def test_load_scheduler_reuses_plugin_lookup():
+    default_sgroup_opts = ScalingGroupOpts()
+    _find_scheduler_cls.cache_clear()
+    with mock.patch('pkg_resources.iter_entry_points', wraps=pkg_resources.iter_entry_points) as m:
+        first = load_scheduler('fifo', default_sgroup_opts, {})
+        second = load_scheduler('fifo', default_sgroup_opts, {})
+    # Each call still returns a fresh scheduler instance with its own config.
+    assert first is not second
+    assert type(first) is type(second)
+    assert m.call_count == 1
+
+
 def test_scheduler_configs():
     example_sgroup_opts = ScalingGroupOpts(  # already processed by column trafaret
         allowed_session_types=[SessionTypes.BATCH],